@@ -1,15 +1,41 @@
 import requests
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib.parse import urlparse, parse_qs
 
-from src.api.models import GitHubRepo
+from src.api.models import GitHubRepo, GitHubRelease, GitHubContributor, GitHubStargazer
+
+
+class RateBudgetExceeded(RuntimeError):
+    """Paginated pull would need more requests than left in the rate limit budget"""
 
 
 class GitHubAPI:
 
-    def __init__(self, token=None):
+    def __init__(self, token=None, max_workers=8, per_page=100, rate_reserve=10):
         self.base_url = "https://api.github.com/"
         self.headers = {}
         if token:
-            raise NotImplementedError('Token not necessary at current capacity - TBA')
+            self.headers['Authorization'] = f'Bearer {token}'
+
+        self.max_workers = max_workers
+        self.per_page = per_page
+        self.rate_reserve = rate_reserve  # requests left untouched for non-paginated calls
+
+        # Sessions arent guaranteed thread-safe (cookies etc. mutated per request) - one per worker thread, only the
+        # adapter (urllib3's thread-safe connection pool) is shared between them
+        self._adapter = HTTPAdapter(pool_maxsize=max_workers)
+        self._local = threading.local()
+
+    def _get_session(self):
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = requests.Session()
+            session.mount('https://', self._adapter)
+            self._local.session = session
+        return session
 
     def _pull_raw_repo_metadata(self, owner, repo):
         endpoint = f"repos/{owner}/{repo}"
@@ -18,10 +44,72 @@ class GitHubAPI:
         res.raise_for_status()
         return res.json()
 
+    def _get_page(self, endpoint, page, headers=None):
+        params = {'per_page': self.per_page, 'page': page}
+        res = self._get_session().get(self.base_url + endpoint, params=params, headers={**self.headers, **(headers or {})})
+        res.raise_for_status()
+        return res
+
+    @staticmethod
+    def _get_page_count(res):
+        # No 'last' link -> everything fit on first page
+        last = res.links.get('last')
+        if not last:
+            return 1
+        return int(parse_qs(urlparse(last['url']).query)['page'][0])
+
+    def _iter_raw_pages(self, endpoint, headers=None):
+        first = self._get_page(endpoint, 1, headers=headers)
+        if first.status_code == 204:
+            return  # No content (e.g. contributors of an empty repo)
+        n_pages = self._get_page_count(first)
+
+        remaining = first.headers.get('X-RateLimit-Remaining')
+        if remaining is not None and n_pages - 1 > int(remaining) - self.rate_reserve:
+            raise RateBudgetExceeded(
+                f'{endpoint} needs {n_pages - 1} more requests, only {remaining} left in rate budget '
+                f'(resets at epoch {first.headers.get("X-RateLimit-Reset")}) - provide/refresh token'
+            )
+
+        yield first.json()
+
+        # Fetch remaining pages concurrently, but keep only a bounded window in flight so pages are
+        # yielded in order without buffering the whole history
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            pending = deque()
+            next_page = 2
+            while pending or next_page <= n_pages:
+                while next_page <= n_pages and len(pending) < self.max_workers * 2:
+                    pending.append(pool.submit(self._get_page, endpoint, next_page, headers))
+                    next_page += 1
+                yield pending.popleft().result().json()
+
     @staticmethod
     def _validate_raw_data(raw_data):
         return GitHubRepo(**raw_data)
 
+    @staticmethod
+    def _validate_raw_rows(raw_page, model, repo_name_full, snapshot_dt):
+        return [model(repo_name_full=repo_name_full, snapshot_dt=snapshot_dt, **row) for row in raw_page]
+
+    def _iter_validated_pages(self, repo_name_full, snapshot_dt, endpoint, model, headers=None):
+        for raw_page in self._iter_raw_pages(f"repos/{repo_name_full}/{endpoint}", headers=headers):
+            yield self._validate_raw_rows(raw_page, model, repo_name_full, snapshot_dt)
+
     def get_repo_metadata(self, owner, repo):
         raw_data = self._pull_raw_repo_metadata(owner, repo)
         return self._validate_raw_data(raw_data)
+
+    # Paginated collectors take repo_name_full & snapshot_dt off get_repo_metadata's result, so rows share the
+    # GITHUB_REPOS key (post-rename/transfer name) and snapshot of the same run
+
+    def iter_repo_releases(self, repo_name_full, snapshot_dt):
+        return self._iter_validated_pages(repo_name_full, snapshot_dt, 'releases', GitHubRelease)
+
+    def iter_repo_contributors(self, repo_name_full, snapshot_dt):
+        return self._iter_validated_pages(repo_name_full, snapshot_dt, 'contributors', GitHubContributor)
+
+    def iter_repo_stargazers(self, repo_name_full, snapshot_dt):
+        # star+json media type is what adds the starred_at timestamp
+        return self._iter_validated_pages(repo_name_full, snapshot_dt, 'stargazers', GitHubStargazer,
+                                          headers={'Accept': 'application/vnd.github.star+json'})
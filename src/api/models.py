@@ -1,27 +1,62 @@
 import re
 from datetime import datetime, date, timezone
-from pydantic import BaseModel, model_validator, field_validator, Field
+from functools import lru_cache
+from packaging.requirements import Requirement, InvalidRequirement
+from packaging.utils import canonicalize_name
+from pydantic import BaseModel, ConfigDict, model_validator, field_validator, Field
 from typing import Optional
 
+from src.utils.github_urls import resolve_github_repo
 
-GITHUB_URL_PATTERN = re.compile(
-    r'(https?://(?:www\.)?github\.com/([a-zA-Z0-9-]+)/([\w.-]+))(?:/.*)?/?'
-)
+
+EXTRA_MARKER_PATTERN = re.compile(r'extra\s*==\s*[\'"]([^\'"]+)[\'"]')
+
+
+@lru_cache(maxsize=None)
+def parse_requirement(req_str):
+    """Parse a single requires_dist entry - cached, as the same strings recur across packages & snapshots"""
+    try:
+        req = Requirement(req_str)
+    except InvalidRequirement:
+        return None
+
+    marker = str(req.marker) if req.marker else None
+    # All extras the marker names (e.g. extra == "a" or extra == "b"), comma separated like extras
+    for_extras = sorted({canonicalize_name(e) for e in EXTRA_MARKER_PATTERN.findall(marker)}) if marker else []
+
+    return (
+        canonicalize_name(req.name),
+        str(req.specifier) or None,
+        ','.join(sorted(req.extras)) or None,
+        marker,
+        ','.join(for_extras) or None,
+    )
 
 
 class PyPIPackageReleaseMD(BaseModel):
     """Single release's metadata"""
+    model_config = ConfigDict(populate_by_name=True)  # cached dumps use field names
+
     version: str
     release_dt: datetime = Field(alias='upload_time_iso_8601')
     source_size: int
 
 
+class PyPIPackageDependency(BaseModel):
+    """Single parsed requires_dist entry"""
+    dependency: str
+    specifier: str | None = None
+    extras: str | None = None
+    marker: str | None = None
+    for_extra: str | None = None
+
+
 class PyPIPackage(BaseModel):
     """Top level package metadata"""
     name: str
     version: str
     summary: str | None = None
-    # dependencies: list[str] = Field(default_factory=list)
+    dependencies: list[PyPIPackageDependency] = Field(default_factory=list)
     releases: list[PyPIPackageReleaseMD] = Field(default_factory=list)
     github_url: str | None = None
     github_owner: str | None = None
@@ -33,6 +68,9 @@ class PyPIPackage(BaseModel):
     @classmethod
     def extract_release_metadata(cls, releases):
 
+        if isinstance(releases, list):
+            return releases  # already processed (cached dump)
+
         if not isinstance(releases, dict):
             return []
 
@@ -55,11 +93,41 @@ class PyPIPackage(BaseModel):
                 })
         return processed_releases
 
+    @field_validator('dependencies', mode='before')
+    @classmethod
+    def parse_requires_dist(cls, requires_dist):
+
+        if not isinstance(requires_dist, list):
+            return []
+
+        processed_deps = []
+        seen = set()
+        for req_str in requires_dist:
+            if not isinstance(req_str, str):
+                processed_deps.append(req_str)  # already parsed
+                continue
+
+            parsed = parse_requirement(req_str)
+            if parsed is None or parsed in seen:
+                continue
+            seen.add(parsed)
+
+            dependency, specifier, extras, marker, for_extra = parsed
+            processed_deps.append({
+                'dependency': dependency,
+                'specifier': specifier,
+                'extras': extras,
+                'marker': marker,
+                'for_extra': for_extra
+            })
+        return processed_deps
+
     @model_validator(mode='before')
     @classmethod
     def process_info_and_urls(cls, data):
 
-        if not isinstance(data, dict):
+        # No info block -> already processed (cached dump)
+        if not isinstance(data, dict) or 'info' not in data:
             return data
 
         info_data = data.get('info', {})
@@ -73,28 +141,19 @@ class PyPIPackage(BaseModel):
         if info_data.get('requires_dist'):
             data['dependencies'] = info_data.get('requires_dist', [])
 
-        # Get github URL
-        project_urls = info_data.get('project_urls', {})
-        for url_name, url in project_urls.items():
-            match = GITHUB_URL_PATTERN.search(url)
-            if match:
-                data['github_url'] = match.group(1)
-                data['github_owner'] = match.group(2)
-                data['github_repo_name'] = match.group(3)
-                data['github_repo_name_full'] = f'{match.group(2)}/{match.group(3)}'
-                break  # is found
-
-        # If no github URL found, try home_page
-        if not 'github_url' in data and 'home_page' in info_data:
-            match = GITHUB_URL_PATTERN.search(info_data.get('home_page'))
-            if match:
-                data['github_url'] = match.group(1)
-                data['github_owner'] = match.group(2)
-                data['github_repo_name'] = match.group(3)
-                data['github_repo_name_full'] = f'{match.group(2)}/{match.group(3)}'
+        # Get github URL (project_urls by key preference, then home_page) - unless pre-resolved in bulk
+        if 'github_url' not in data:
+            github_fields, _ = resolve_github_repo(info_data)
+            if github_fields:
+                data.update(github_fields)
 
         return data
 
+    @classmethod
+    def from_cached(cls, payload):
+        """Rebuild from a model_dump() payload - before-validators pass it straight through, no info/URL parsing"""
+        return cls.model_validate(payload)
+
 
 class PyPIPackageDownloadCount(BaseModel):
     """Per row download query"""
@@ -119,3 +178,53 @@ class GitHubRepo(BaseModel):
     updated_at: datetime
     pushed_at: datetime
     snapshot_dt: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+
+    @field_validator('repo_name_full')
+    @classmethod
+    def lowercase_repo_name_full(cls, repo_name_full):
+        # Keyed lowercase, to line up with PYPI_PACKAGES.GITHUB_REPO_NAME_FULL (API returns e.g. PrefectHQ/prefect)
+        return repo_name_full.lower()
+
+
+class GitHubRelease(BaseModel):
+    """Single release, as listed by repos/{owner}/{repo}/releases"""
+    repo_name_full: str
+    release_id: int = Field(alias='id')
+    tag_name: str
+    release_name: str | None = Field(default=None, alias='name')
+    author_login: str | None = None
+    is_draft: bool = Field(alias='draft')
+    is_prerelease: bool = Field(alias='prerelease')
+    created_at: datetime
+    published_at: datetime | None = None
+    snapshot_dt: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+
+    @model_validator(mode='before')
+    @classmethod
+    def extract_author(cls, data):
+        if isinstance(data, dict) and isinstance(data.get('author'), dict):
+            data['author_login'] = data['author'].get('login')
+        return data
+
+
+class GitHubContributor(BaseModel):
+    """Single contributor, as listed by repos/{owner}/{repo}/contributors"""
+    repo_name_full: str
+    login: str
+    contributions: int
+    snapshot_dt: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+
+
+class GitHubStargazer(BaseModel):
+    """Single star event, as listed by repos/{owner}/{repo}/stargazers (star+json media type)"""
+    repo_name_full: str
+    login: str
+    starred_at: datetime
+    snapshot_dt: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+
+    @model_validator(mode='before')
+    @classmethod
+    def extract_user(cls, data):
+        if isinstance(data, dict) and isinstance(data.get('user'), dict):
+            data['login'] = data['user'].get('login')
+        return data
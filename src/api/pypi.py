@@ -116,6 +116,13 @@ class PyPIJSONApi:
     def _validate_raw_data(raw_data):
         return PyPIPackage(**raw_data)
 
-    def get_package_metadata(self, pkg):
+    def get_package_metadata(self, pkg, resolver=None):
         raw_data = self._pull_raw_package_metadata(pkg)
+        if resolver is not None:
+            raw_data.update(resolver.resolve(raw_data))
         return self._validate_raw_data(raw_data)
+
+    @staticmethod
+    def load_cached_package_metadata(payloads):
+        # Cached payloads skip the raw API reshaping, only field validation is rerun
+        return [PyPIPackage.from_cached(payload) for payload in payloads]
@@ -1,4 +1,5 @@
 from sqlalchemy import (
+    Boolean,
     Column,
     Integer,
     String,
@@ -36,7 +37,7 @@ class PyPIPackages(Base):
 
     releases = relationship("PyPIPackageReleases", back_populates="package")
     downloads = relationship("PyPIDownloadCounts", back_populates="package")
-    # dependencies = relationship("PyPIPackages", back_populates="package")
+    dependencies = relationship("PyPIDependencies", back_populates="package")
 
     # cant guarantee github entires in pypi not null, cant key
     # github_repos = relationship("GitHubRepos", back_populates="packages")
@@ -60,14 +61,24 @@ class PyPIPackageReleases(Base):
 
     package = relationship("PyPIPackages", back_populates="releases")
 
-# class PyPIDependencies(Base):
-#     __tablename__ = "PYPI_DEPENDENCIES"
-#
-#     id = Column("ID", Integer, primary_key=True, autoincrement=True)
-#     package_name = Column("PACKAGE_NAME", String(500), ForeignKey("pypi_packages.package_name"))
-#     dependency = Column("DEPENDENCY", String(500), nullable=False)
-#
-#     package = relationship("PyPIPackages", back_populates="dependencies")
+
+class PyPIDependencies(Base):
+    __tablename__ = "PYPI_DEPENDENCIES"
+
+    id = Column("ID", Integer, primary_key=True, autoincrement=True)  # Surrogate - same dep can repeat per marker
+
+    package_name = Column("PACKAGE_NAME", String(500), ForeignKey("PYPI_PACKAGES.PACKAGE_NAME"))
+    # Not keyed to PYPI_PACKAGES - most dependencies arent tracked packages themselves.
+    # PEP 503 normalized, unlike PACKAGE_NAME (display name) - normalize PACKAGE_NAME to join the two
+    dependency = Column("DEPENDENCY", String(500), nullable=False)
+    specifier = Column("SPECIFIER", String(500), nullable=True)
+    extras = Column("EXTRAS", String(500), nullable=True)
+    marker = Column("MARKER", String(500), nullable=True)
+    for_extra = Column("FOR_EXTRA", String(500), nullable=True)
+    version = Column("VERSION", String(500), nullable=False)  # package version edges were pulled for
+    pulled_dt = Column("PULLED_DT", DateTime, nullable=False)
+
+    package = relationship("PyPIPackages", back_populates="dependencies")
 
 
 class PyPIDownloadCounts(Base):
@@ -125,3 +136,61 @@ class GitHubRepos(Base):
     # packages = relationship("PyPIPackages", back_populates="github_repos")
 
 
+class GitHubReleases(Base):
+    __tablename__ = 'GITHUB_RELEASES'
+
+    repo_name_full = Column("REPO_NAME_FULL", String(500), nullable=False)
+    release_id = Column("RELEASE_ID", Integer, nullable=False)
+    tag_name = Column("TAG_NAME", String(500), nullable=False)
+    release_name = Column("RELEASE_NAME", String(500), nullable=True)
+    author_login = Column("AUTHOR_LOGIN", String(500), nullable=True)
+    is_draft = Column("IS_DRAFT", Boolean, nullable=False)
+    is_prerelease = Column("IS_PRERELEASE", Boolean, nullable=False)
+    created_at = Column("CREATED_AT", DateTime(timezone=True), nullable=False)
+    published_at = Column("PUBLISHED_AT", DateTime(timezone=True), nullable=True)
+    snapshot_dt = Column("SNAPSHOT_DT", DateTime(timezone=True), nullable=False)
+
+    __table_args__ = (
+        PrimaryKeyConstraint(
+            "REPO_NAME_FULL",
+            "RELEASE_ID",
+            "SNAPSHOT_DT",
+            name="PK_GITHUB_RELEASES"
+        ),
+    )
+
+
+class GitHubContributors(Base):
+    __tablename__ = 'GITHUB_CONTRIBUTORS'
+
+    repo_name_full = Column("REPO_NAME_FULL", String(500), nullable=False)
+    login = Column("LOGIN", String(500), nullable=False)
+    contributions = Column("CONTRIBUTIONS", Integer, nullable=False)
+    snapshot_dt = Column("SNAPSHOT_DT", DateTime(timezone=True), nullable=False)
+
+    __table_args__ = (
+        PrimaryKeyConstraint(
+            "REPO_NAME_FULL",
+            "LOGIN",
+            "SNAPSHOT_DT",
+            name="PK_GITHUB_CONTRIBUTORS"
+        ),
+    )
+
+
+class GitHubStargazers(Base):
+    __tablename__ = 'GITHUB_STARGAZERS'
+
+    repo_name_full = Column("REPO_NAME_FULL", String(500), nullable=False)
+    login = Column("LOGIN", String(500), nullable=False)
+    starred_at = Column("STARRED_AT", DateTime(timezone=True), nullable=False)
+    snapshot_dt = Column("SNAPSHOT_DT", DateTime(timezone=True), nullable=False)
+
+    __table_args__ = (
+        PrimaryKeyConstraint(
+            "REPO_NAME_FULL",
+            "LOGIN",
+            "SNAPSHOT_DT",
+            name="PK_GITHUB_STARGAZERS"
+        ),
+    )
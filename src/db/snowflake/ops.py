@@ -6,7 +6,7 @@ from src.db.snowflake.models import (
     Base, 
     PyPIPackages, 
     PyPIPackageReleases, 
-    # PyPIDependencies
+    PyPIDependencies
 )
 
 def get_engine():
@@ -63,12 +63,38 @@ def insert_pypi_package(md, session):
         ])
 
     # Insert dependencies
-    # for dep in md.dependencies or []:
-    #     dep_row = PyPIDependencies(
-    #         package_name=md.name,
-    #         dependency=dep
-    #     )
-    #     session.add(dep_row)
+    # bulk insert dependency edges (plain mappings, no ORM object overhead)
+    if md.dependencies:
+        session.bulk_insert_mappings(PyPIDependencies, [
+            {'package_name': md.name, 'version': md.version, 'pulled_dt': md.snapshot_dt, **dict(d)}
+            for d in md.dependencies
+        ])
 
     # Commit
     session.commit()
+
+
+def insert_paginated_rows(pages, orm_model, session, batch_size=1000):
+
+    # Stream pages of validated rows in, sending every batch_size rows - full histories never held in memory.
+    # Committed once at the end, a failed page rolls back the whole snapshot rather than leaving it truncated
+    batch = []
+    n_rows = 0
+    try:
+        for page in pages:
+            batch.extend(dict(row) for row in page)
+            if len(batch) >= batch_size:
+                session.bulk_insert_mappings(orm_model, batch)
+                n_rows += len(batch)
+                batch = []
+
+        if batch:
+            session.bulk_insert_mappings(orm_model, batch)
+            n_rows += len(batch)
+
+        session.commit()
+    except Exception:
+        session.rollback()
+        raise
+
+    return n_rows
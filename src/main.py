@@ -1,17 +1,27 @@
 import os
+import requests
 from datetime import date
 from dotenv import load_dotenv
 
 from src.api.models import GitHubRepo
 from src.api.pypi import PyPIJSONApi, PyPIBigQuery
-from src.api.github import GitHubAPI
+from src.api.github import GitHubAPI, RateBudgetExceeded
+from src.utils.github_urls import GitHubRepoResolver
 from src.db.snowflake.ops import (
     init_schema,
     get_engine,
     get_session,
-    insert_pypi_package
+    insert_pypi_package,
+    insert_paginated_rows
+)
+from src.db.snowflake.models import (
+    PyPIDownloadCounts,
+    PyPIPackages,
+    GitHubRepos,
+    GitHubReleases,
+    GitHubContributors,
+    GitHubStargazers
 )
-from src.db.snowflake.models import PyPIDownloadCounts, PyPIPackages, GitHubRepos
 
 
 if __name__ == '__main__':
@@ -39,13 +49,15 @@ if __name__ == '__main__':
     print('------------------------------------------')
     print('Getting package metadata via PyPI JSON API')
     print('------------------------------------------')
+    resolver = GitHubRepoResolver()
     for pkg in packages:
         print(pkg)
         print('- Pulling data...')
-        md = PyPIJSONApi().get_package_metadata(pkg)
+        md = PyPIJSONApi().get_package_metadata(pkg, resolver=resolver)
         print('- Writing to DB...')
         insert_pypi_package(md, session)
         print('- Done!')
+    print(f'GitHub match quality: {resolver.match_quality_stats()}')
 
     print('-------------------------------------------------')
     print('Getting package download data via PyPI BQ Dataset')
@@ -70,6 +82,11 @@ if __name__ == '__main__':
     print('-------------------------------------')
     print('Getting repo data via GitHub Rest API')
     print('-------------------------------------')
+    github_token = os.environ.get('GITHUB_TOKEN')
+    if not github_token:
+        print('WARNING: GITHUB_TOKEN not set - unauthenticated budget is 60 requests/hour, '
+              'paginated collectors for larger repos will be skipped')
+
     for pkg in packages:
         print(pkg)
         print('- Getting previously found GitHub info...')
@@ -90,10 +107,28 @@ if __name__ == '__main__':
         print(f"--> Owner/Repo: {github_owner}/{github_repo_name}")
 
         print('- Pulling data...')
-        api = GitHubAPI()
+        api = GitHubAPI(token=github_token)
         data = api.get_repo_metadata(owner=github_owner, repo=github_repo_name)
         print('- Writing to DB...')
         entry = GitHubRepos(**dict(data))
         session.add(entry)
         session.commit()
+
+        # Paginated histories - streamed page by page into DB
+        collectors = [
+            ('releases', api.iter_repo_releases, GitHubReleases),
+            ('contributors', api.iter_repo_contributors, GitHubContributors),
+            ('stargazers', api.iter_repo_stargazers, GitHubStargazers),
+        ]
+        for label, collector, orm_model in collectors:
+            print(f'- Pulling & writing {label}...')
+            # Rate budget, HTTP errors & bad pages (ValueError) only skip this collector
+            try:
+                n_rows = insert_paginated_rows(
+                    collector(repo_name_full=data.repo_name_full, snapshot_dt=data.snapshot_dt), orm_model, session
+                )
+            except (RateBudgetExceeded, requests.RequestException, ValueError) as e:
+                print(f'--> Skipped {label}: {e}')
+                continue
+            print(f'--> {n_rows} rows')
         print('- Done!')
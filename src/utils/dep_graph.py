@@ -0,0 +1,184 @@
+from packaging.utils import canonicalize_name
+
+
+class DependencyGraph:
+    """
+    In-memory adjacency index over PYPI_DEPENDENCIES edges.
+
+    Nodes are interned to ints, cycles are collapsed into strongly connected components, and the transitive
+    dependents of every component are precomputed as int bitsets in one pass over the condensed DAG. Lookups
+    afterward are a dict hit plus bitset decode, rather than a recursive query per package.
+    """
+
+    def __init__(self, edges=()):
+        self._ids = {}
+        self._names = []
+        self._deps = []     # node -> set of nodes it depends on
+        self._rdeps = []    # node -> set of nodes depending on it
+        self._closure = None
+        self._comp_of = None
+
+        self.add_edges(edges)
+
+    @classmethod
+    def from_session(cls, session, include_optional=False):
+        from sqlalchemy import and_, func
+        from src.db.snowflake.models import PyPIPackages, PyPIDependencies
+
+        # Edges are appended every run - only read each package's latest pull. Taken off PYPI_PACKAGES, so a
+        # package whose latest pull has no dependencies doesnt fall back to its older edges
+        latest = (
+            session.query(
+                PyPIPackages.package_name,
+                func.max(PyPIPackages.pulled_dt).label('pulled_dt')
+            )
+            .group_by(PyPIPackages.package_name)
+            .subquery()
+        )
+        q = (
+            session.query(PyPIDependencies.package_name, PyPIDependencies.dependency)
+            .join(latest, and_(
+                PyPIDependencies.package_name == latest.c.package_name,
+                PyPIDependencies.pulled_dt == latest.c.pulled_dt
+            ))
+        )
+        if not include_optional:
+            q = q.filter(PyPIDependencies.for_extra.is_(None))
+        return cls(q.yield_per(10_000))
+
+    def _node(self, name):
+        name = canonicalize_name(name)
+        idx = self._ids.get(name)
+        if idx is None:
+            idx = len(self._names)
+            self._ids[name] = idx
+            self._names.append(name)
+            self._deps.append(set())
+            self._rdeps.append(set())
+        return idx
+
+    def add_edges(self, edges):
+        for pkg, dep in edges:
+            src, dst = self._node(pkg), self._node(dep)
+            if src == dst:
+                continue
+            self._deps[src].add(dst)
+            self._rdeps[dst].add(src)
+        self._closure = None
+
+    def __len__(self):
+        return len(self._names)
+
+    def __contains__(self, name):
+        return canonicalize_name(name) in self._ids
+
+    def _strongly_connected_components(self):
+        # Iterative Tarjan over the dependents direction - deep chains would blow the recursion limit.
+        # Components are emitted dependents-first, i.e. a component only after everything reachable from it.
+        n = len(self._names)
+        index = [-1] * n
+        low = [0] * n
+        on_stack = [False] * n
+        stack = []
+        comp_of = [-1] * n
+        comps = []
+        counter = 0
+
+        for root in range(n):
+            if index[root] != -1:
+                continue
+            work = [(root, iter(self._rdeps[root]))]
+            index[root] = low[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack[root] = True
+
+            while work:
+                node, children = work[-1]
+                advanced = False
+                for child in children:
+                    if index[child] == -1:
+                        index[child] = low[child] = counter
+                        counter += 1
+                        stack.append(child)
+                        on_stack[child] = True
+                        work.append((child, iter(self._rdeps[child])))
+                        advanced = True
+                        break
+                    elif on_stack[child]:
+                        low[node] = min(low[node], index[child])
+                if advanced:
+                    continue
+
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    low[parent] = min(low[parent], low[node])
+
+                if low[node] == index[node]:
+                    members = []
+                    while True:
+                        member = stack.pop()
+                        on_stack[member] = False
+                        comp_of[member] = len(comps)
+                        members.append(member)
+                        if member == node:
+                            break
+                    comps.append(members)
+
+        return comps, comp_of
+
+    def _build_closure(self):
+        comps, comp_of = self._strongly_connected_components()
+
+        closure = [0] * len(comps)
+        for c, members in enumerate(comps):
+            bits = 0
+            for m in members:
+                bits |= 1 << m
+            for m in members:
+                for r in self._rdeps[m]:
+                    rc = comp_of[r]
+                    if rc != c:
+                        bits |= closure[rc]  # already complete - emitted earlier
+            closure[c] = bits
+
+        self._closure = closure
+        self._comp_of = comp_of
+
+    def _dependents_bits(self, idx):
+        if self._closure is None:
+            self._build_closure()
+        # Members of own cycle are dependents of themselves, but node itself is not
+        return self._closure[self._comp_of[idx]] & ~(1 << idx)
+
+    def _decode(self, bits):
+        names = []
+        while bits:
+            low_bit = bits & -bits
+            names.append(self._names[low_bit.bit_length() - 1])
+            bits ^= low_bit
+        return names
+
+    def direct_dependencies(self, name):
+        idx = self._ids.get(canonicalize_name(name))
+        if idx is None:
+            return set()
+        return {self._names[d] for d in self._deps[idx]}
+
+    def direct_dependents(self, name):
+        idx = self._ids.get(canonicalize_name(name))
+        if idx is None:
+            return set()
+        return {self._names[r] for r in self._rdeps[idx]}
+
+    def transitive_dependents(self, name):
+        idx = self._ids.get(canonicalize_name(name))
+        if idx is None:
+            return set()
+        return set(self._decode(self._dependents_bits(idx)))
+
+    def reverse_dependency_counts(self, transitive=False):
+        if not transitive:
+            return {name: len(self._rdeps[i]) for i, name in enumerate(self._names)}
+        return {name: self._dependents_bits(i).bit_count() for i, name in enumerate(self._names)}
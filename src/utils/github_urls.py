@@ -0,0 +1,115 @@
+import re
+from collections import Counter
+from functools import lru_cache
+
+
+# Covers https/http, www., git+https://, git://, ssh & scp-style (git@github.com:owner/repo) forms
+GITHUB_URL_PATTERN = re.compile(
+    r'(?:https?://|git://|ssh://git@|git@)(?:www\.)?github\.com[/:]([a-zA-Z0-9-]+)/([\w.-]+)',
+    re.IGNORECASE
+)
+
+# First path segments on github.com that arent owners
+_RESERVED_OWNERS = {
+    'about', 'apps', 'collections', 'contact', 'customer-stories', 'enterprise', 'explore', 'features',
+    'login', 'marketplace', 'orgs', 'pricing', 'security', 'settings', 'site', 'sponsors', 'topics', 'users',
+}
+
+# Normalized project_urls keys, in order of preference
+_PREFERRED_KEYS = ('source', 'sourcecode', 'repository', 'repo', 'code', 'github')
+
+MATCH_QUALITIES = ('preferred_key', 'other_key', 'home_page', 'unmatched')
+
+UNMATCHED_FIELDS = {
+    'github_url': None,
+    'github_owner': None,
+    'github_repo_name': None,
+    'github_repo_name_full': None
+}
+
+
+def _key_rank(url_name):
+    key = re.sub(r'[^a-z]', '', url_name.lower())
+    return _PREFERRED_KEYS.index(key) if key in _PREFERRED_KEYS else len(_PREFERRED_KEYS)
+
+
+@lru_cache(maxsize=None)
+def parse_github_url(url):
+    """Owner/repo out of a single URL - memoized, as the same URLs recur across packages & snapshots"""
+    match = GITHUB_URL_PATTERN.search(url)
+    if not match:
+        return None
+
+    owner, repo = match.group(1), match.group(2)
+    if repo.lower().endswith('.git'):
+        repo = repo[:-4]
+    if owner.lower() in _RESERVED_OWNERS or not repo.strip('.'):
+        return None
+
+    # Canonical form of what GitHub would redirect to (https, no www, no .git) - display case kept in URL only,
+    # owner/repo are lowercased as GitHub treats them case-insensitively & theyre used as keys
+    return f'https://github.com/{owner}/{repo}', owner.lower(), repo.lower()
+
+
+def resolve_github_repo(info_data, parse=parse_github_url):
+    """Pick GitHub repo for a package's info block - returns (github_* fields or None, match quality)"""
+    project_urls = info_data.get('project_urls') or {}
+
+    ranked = sorted(((_key_rank(url_name), url) for url_name, url in project_urls.items()), key=lambda t: t[0])
+    candidates = [(url, 'preferred_key' if rank < len(_PREFERRED_KEYS) else 'other_key') for rank, url in ranked]
+    candidates.append((info_data.get('home_page'), 'home_page'))
+
+    for url, quality in candidates:
+        if not isinstance(url, str):
+            continue
+        parsed = parse(url)
+        if parsed:
+            github_url, owner, repo = parsed
+            fields = {
+                'github_url': github_url,
+                'github_owner': owner,
+                'github_repo_name': repo,
+                'github_repo_name_full': f'{owner}/{repo}'
+            }
+            return fields, quality
+
+    return None, 'unmatched'
+
+
+class GitHubRepoResolver:
+    """
+    Owner/repo resolution shared across many PyPI JSON payloads (one per resolve call), tracking match quality.
+
+    Resolved fields are merged into the payload before validation (see PyPIJSONApi.get_package_metadata), which
+    PyPIPackage then takes as-is instead of resolving again.
+    """
+
+    def __init__(self):
+        self.stats = Counter({q: 0 for q in MATCH_QUALITIES})
+        self._seen_urls = set()  # only for this resolver's own hit rate - results live in parse_github_url's cache
+        self.url_hits = 0
+        self.url_misses = 0
+
+    def _parse(self, url):
+        if url in self._seen_urls:
+            self.url_hits += 1
+        else:
+            self.url_misses += 1
+            self._seen_urls.add(url)
+        return parse_github_url(url)
+
+    def resolve(self, payload):
+        info_data = payload.get('info', payload)
+        fields, quality = resolve_github_repo(info_data, parse=self._parse)
+        self.stats[quality] += 1
+        return fields or dict(UNMATCHED_FIELDS)
+
+    def match_quality_stats(self):
+        total = sum(self.stats.values())
+        lookups = self.url_hits + self.url_misses
+        return {
+            'total': total,
+            'counts': dict(self.stats),
+            'shares': {q: (n / total if total else 0.0) for q, n in self.stats.items()},
+            'url_cache_hit_rate': self.url_hits / lookups if lookups else 0.0,
+        }